@@ -1,4 +1,11 @@
 import os
+from typing import Any
+from uuid import uuid4
+
+import orjson
+
+from sqlalchemy import cast
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
@@ -13,9 +20,31 @@ if DATABASE_URL.startswith("postgresql://"):
 # uncomment the next line:
 # DATABASE_URL += "?sslmode=require"
 
+# In production DATABASE_URL points at PgBouncer (port 6432, transaction pooling),
+# which can't keep server-side prepared statements across transactions, so the
+# asyncpg statement caches are disabled and each statement gets a unique name
+# (asyncpg's default __asyncpg_stmt_N__ names collide on shared backends).
+# JIT is disabled server-side by migration a7c3e9f052b1 (ALTER DATABASE ... SET
+# jit = off): PgBouncer drops client startup parameters, so a per-connection
+# server_settings value would never reach Postgres.
+#
+# Size the pool for /analyze's concurrent workload. create_async_engine already
+# uses AsyncAdaptedQueuePool; don't pass poolclass=QueuePool here.
 engine = create_async_engine(
     DATABASE_URL,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_recycle=1800,
     pool_pre_ping=True,
+    connect_args={
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    },
+    # orjson for JSONB bind/result values (scores, claims, highlight data)
+    json_serializer=lambda v: orjson.dumps(v).decode(),
+    json_deserializer=orjson.loads,
     echo=False,
 )
 
@@ -28,3 +57,12 @@ SessionLocal = sessionmaker(
 async def get_db():
     async with SessionLocal() as session:
         yield session
+
+
+def jsonb_contains(col, payload: Any):
+    """`col @> payload` — the only JSONB predicate the jsonb_path_ops GIN indexes serve.
+
+    Use this instead of `col["key"] == ...` / `.op("->>")` comparisons, which
+    bypass the index and fall back to a sequential scan.
+    """
+    return col.op("@>")(cast(payload, JSONB))
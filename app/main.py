@@ -1,11 +1,16 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.db import engine, Base
-from app.utils.config import CORS_ORIGINS
+from app.utils.config import CORS_ORIGINS, PARSE_WORKERS
 from app.routes.articles import router as articles_router
 from app.routes.narrative import router as narratives_router
 from app.routes.highlights import router as highlights_router
 from app.routes.analyze import router as analyze_router
+from app.services.sourcing import aclose_tavily
 import os
 
 app = FastAPI()
@@ -35,6 +40,36 @@ app.include_router(analyze_router)
 
 @app.on_event("startup")
 async def on_startup():
-    # Create tables (dev-only)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Small default executor for asyncio.to_thread: only HTML parsing uses it now
+    # that LLM and search calls are async
+    app.state.executor = ThreadPoolExecutor(max_workers=PARSE_WORKERS, thread_name_prefix="parse")
+    asyncio.get_running_loop().set_default_executor(app.state.executor)
+
+    # Shared client for article fetches: keep-alive + HTTP/2 reuse across requests
+    app.state.http = httpx.AsyncClient(
+        timeout=20,
+        follow_redirects=True,
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        headers={
+            "User-Agent": (
+                "Mozilla/5.0 (Macintosh; Intel Mac OS X) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/125 Safari/537.36"
+            ),
+            "Accept-Language": "en-US,en;q=0.9",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        },
+    )
+
+    # Schema is managed by Alembic (`alembic upgrade head` as a deploy step).
+    # For throwaway local DBs, DEV_CREATE_ALL=1 creates tables from the models.
+    if os.getenv("DEV_CREATE_ALL"):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await app.state.http.aclose()
+    await aclose_tavily()
+    app.state.executor.shutdown(wait=False, cancel_futures=True)
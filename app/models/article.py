@@ -1,17 +1,41 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from sqlalchemy import DateTime, Integer, String, Text, func
+from sqlalchemy import DateTime, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db import Base
 
+if TYPE_CHECKING:
+    from app.models.highlight import Highlight
+
 
 class Article(Base):
+    """Analyzed article.
+
+    Filter JSONB columns with containment, e.g.
+    `jsonb_contains(Article.scores, {"emotional_tone": 80})` (app.db), so the
+    query hits idx_articles_scores_gin / idx_articles_claims_gin; `->`/`->>`
+    comparisons are not index-accelerated.
+    """
+
     __tablename__ = "articles"
+    __table_args__ = (
+        # one row per URL; /analyze upserts on it (ON CONFLICT (url) WHERE url IS NOT NULL)
+        Index("uq_articles_url", "url", unique=True, postgresql_where=text("url IS NOT NULL")),
+        # jsonb_path_ops GIN indexes only accelerate containment (@>) predicates
+        Index(
+            "idx_articles_scores_gin", "scores",
+            postgresql_using="gin", postgresql_ops={"scores": "jsonb_path_ops"},
+        ),
+        Index(
+            "idx_articles_claims_gin", "claims",
+            postgresql_using="gin", postgresql_ops={"claims": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
@@ -28,6 +52,24 @@ class Article(Base):
     # shape: [{text, rationale?, confidence?, sources:[{title?,url}...]}]
     claims: Mapped[list[dict[str, Any]]] = mapped_column(JSONB, nullable=False, default=list)
 
+    # Provider response behind `scores` (NULL for rule-based scores), so a re-analysis
+    # of unchanged text under the same model/prompts re-parses instead of re-calling.
+    # shape: {policy, snippet, response}; see app.services.llm.llm_score_from_raw.
+    # Deferred: not part of the API output, so plain Article loads skip it.
+    llm_raw: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+        JSONB(none_as_null=True), nullable=True, deferred=True, deferred_raiseload=True
+    )
+    llm_model: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    # Normalized rows in the highlights table (the JSONB `highlights` column above
+    # is a denormalized copy). lazy="raise": load explicitly, e.g. joinedload().
+    highlight_rows: Mapped[List[Highlight]] = relationship(
+        back_populates="article",
+        lazy="raise",
+        order_by="Highlight.id",
+        passive_deletes=True,
+    )
+
     # Timestamps
     published_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
@@ -35,4 +77,13 @@ class Article(Base):
     )
     updated_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True, onupdate=func.now()
-    )
\ No newline at end of file
+    )
+
+
+# Newest-first scans that read only these columns (e.g. /narratives/cluster)
+# are answered from the index alone; JSONB/TOASTed columns stay out of INCLUDE.
+Index(
+    "idx_articles_recent_cover",
+    Article.id.desc(),
+    postgresql_include=["title", "outlet", "url", "published_at"],
+)
@@ -1,10 +1,20 @@
-from sqlalchemy import Column, Integer, ForeignKey, String, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, String, DateTime, Index
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db import Base
 
 class Highlight(Base):
     __tablename__ = "highlights"
+    __table_args__ = (
+        # Serves WHERE article_id = ? ORDER BY id (asc or desc) without a sort;
+        # also covers plain article_id lookups such as the FK cascade.
+        Index("idx_highlights_article_id_id", "article_id", "id"),
+        Index(
+            "idx_highlights_data_gin", "data",
+            postgresql_using="gin", postgresql_ops={"data": "jsonb_path_ops"},
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), nullable=False)
@@ -16,4 +26,6 @@ class Highlight(Base):
     # Example: {"text":"critics say","start":102,"end":113,"reason":"vague attribution","confidence":0.72}
     data = Column(JSONB, nullable=False)
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    article = relationship("Article", back_populates="highlight_rows", lazy="raise")
@@ -1,10 +1,19 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from app.db import Base
 
 class Narrative(Base):
     __tablename__ = "narratives"
+    __table_args__ = (
+        Index(
+            "idx_narratives_data_gin", "data",
+            postgresql_using="gin", postgresql_ops={"data": "jsonb_path_ops"},
+        ),
+    )
+    # fetch server defaults (id, created_at) via INSERT ... RETURNING on flush,
+    # so new rows don't need a refresh() round-trip afterwards
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     label = Column(String(256), nullable=False)
@@ -2,22 +2,34 @@ from __future__ import annotations
 
 import asyncio
 import re
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from pydantic import BaseModel, field_validator
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+try:  # optional C-backed HTML parser (Lexbor; selectolax's Modest backend is gone in 1.x)
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser, SelectolaxError
+except ImportError:
+    HTMLParser = None
+
 from app.db import get_db
 from app.models.article import Article
 from app.models.highlight import Highlight
 from app.routes.articles import ArticleOut
 
-from app.services.llm import llm_score, llm_summary, extract_claims
-from app.services.sourcing import find_primary_sources
+from app.services.llm import (
+    llm_score_async, llm_score_from_raw, llm_summary_async, extract_claims_async,
+    claims_fallback, score_fallback, summary_fallback, LLM_POLICY,
+)
+from app.services.sourcing import find_primary_sources_async
+from app.services.cache import cache_get, cache_set, content_hash
 from app.services.highlight_extractor import extract_highlights as local_extract_highlights
+from app.utils.config import LLM_CONCURRENCY
 
 router = APIRouter(prefix="/analyze", tags=["analyze"])
 
@@ -34,14 +46,44 @@ class AnalyzeIn(BaseModel):
         return v if v and str(v).strip() else None
 
 
+_RX_SCRIPT = re.compile(r"<script.*?</script>", re.S | re.I)
+_RX_STYLE = re.compile(r"<style.*?</style>", re.S | re.I)
+_RX_TAG = re.compile(r"<[^>]+>")
+_RX_WS = re.compile(r"\s+")
+_RX_SENT = re.compile(r"(?<=[.!?])\s+")
+
+
 def _strip_html(html: str) -> str:
-    text = re.sub(r"<script.*?</script>", " ", html, flags=re.S | re.I)
-    text = re.sub(r"<style.*?</style>", " ", text, flags=re.S | re.I)
-    text = re.sub(r"<[^>]+>", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    if HTMLParser is not None:
+        try:
+            tree = HTMLParser(html)
+            tree.strip_tags(["script", "style", "noscript"])
+            node = tree.body or tree.root
+            if node is not None:
+                return " ".join(node.text(separator=" ").split())
+        except SelectolaxError:
+            # Lexbor couldn't build a document from this input; regex below
+            pass
+    return _strip_html_regex(html)
+
+
+def _strip_html_regex(html: str) -> str:
+    text = _RX_SCRIPT.sub(" ", html)
+    text = _RX_STYLE.sub(" ", text)
+    text = _RX_TAG.sub(" ", text)
+    text = _RX_WS.sub(" ", text).strip()
     return text
 
 
+# Caps in-flight LLM calls per process so bursts don't trip provider rate limits
+_LLM_SEM = asyncio.Semaphore(LLM_CONCURRENCY)
+
+
+async def _run_llm(fn, *args):
+    async with _LLM_SEM:
+        return await fn(*args)
+
+
 def _bias_band(v: int) -> str:
     if v < 30:
         return "low"
@@ -64,47 +106,20 @@ def _bias_index_from_scores(scores: Dict[str, Any]) -> int:
     return int(max(0, min(100, round(val))))
 
 
-@router.post("", response_model=ArticleOut, status_code=201)
-async def analyze(
-    payload: AnalyzeIn,
-    db: AsyncSession = Depends(get_db),
-    full: bool = Query(False, description="Include claims + primary sources (slower)"),
-):
-    if not payload.url and not payload.text:
-        raise HTTPException(status_code=400, detail="Provide url or text")
-
-    # 1) Acquire text
-    article_text = payload.text
-    if not article_text and payload.url:
-        try:
-            async with httpx.AsyncClient(
-                timeout=20,
-                follow_redirects=True,
-                headers={
-                    "User-Agent": (
-                        "Mozilla/5.0 (Macintosh; Intel Mac OS X) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/125 Safari/537.36"
-                    ),
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                },
-            ) as client:
-                res = await client.get(payload.url, follow_redirects=True)
-                res.raise_for_status()
-                article_text = _strip_html(res.text)
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Failed to fetch URL: {e}")
+async def _llm_tasks(
+    article_text: str, full: bool, stored_score: Optional[Dict[str, Any]] = None
+) -> Tuple[Dict[str, Any], str, List[Dict[str, Any]]]:
+    """Score + summary (+ claims when full), each bounded by a timeout.
 
-    if not article_text:
-        raise HTTPException(status_code=400, detail="No text to analyze")
-
-    # 2) LLM tasks
+    stored_score (re-parsed from articles.llm_raw) replaces the scoring call.
+    """
     async def _run_score():
-        return await asyncio.to_thread(llm_score, article_text)
+        if stored_score is not None:
+            return stored_score
+        return await _run_llm(llm_score_async, article_text)
 
     async def _run_summary():
-        return await asyncio.to_thread(llm_summary, article_text)
+        return await _run_llm(llm_summary_async, article_text)
 
     tasks: List[asyncio.Future] = [
         asyncio.wait_for(_run_score(), timeout=25),
@@ -112,7 +127,7 @@ async def analyze(
     ]
     if full:
         async def _run_claims():
-            return await asyncio.to_thread(extract_claims, article_text)
+            return await _run_llm(extract_claims_async, article_text)
         tasks.append(asyncio.wait_for(_run_claims(), timeout=25))
 
     try:
@@ -121,11 +136,95 @@ async def analyze(
         summary_text = results[1]
         claims: List[Dict[str, Any]] = results[2] if full and len(results) > 2 else []
     except asyncio.TimeoutError:
-        # fallbacks (don’t fail the request)
-        score_res = await asyncio.to_thread(llm_score, article_text)
-        summary_text = await asyncio.to_thread(llm_summary, article_text)
+        # fallbacks (don’t fail the request); already out of time, so no second LLM call
+        score_res = stored_score or score_fallback(article_text)
+        summary_text = summary_fallback(article_text)
         claims = []
 
+    return score_res, summary_text, claims
+
+
+# Below this a multi-row INSERT is cheaper than setting up a COPY
+_COPY_MIN_ROWS = 50
+
+
+async def _insert_highlights(db: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+    """Bulk-insert highlight rows inside the session's current transaction.
+
+    Large batches go through asyncpg's binary COPY protocol on the session's own
+    connection; small ones use a single executemany INSERT.
+    """
+    if not rows:
+        return
+    if len(rows) < _COPY_MIN_ROWS:
+        await db.execute(insert(Highlight), rows)
+        return
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        Highlight.__tablename__,
+        records=[
+            (r["article_id"], r["dimension"], orjson.dumps(r["data"]).decode())
+            for r in rows
+        ],
+        columns=["article_id", "dimension", "data"],
+    )
+
+
+@router.post("", response_model=ArticleOut, status_code=201)
+async def analyze(
+    payload: AnalyzeIn,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    full: bool = Query(False, description="Include claims + primary sources (slower)"),
+):
+    if not payload.url and not payload.text:
+        raise HTTPException(status_code=400, detail="Provide url or text")
+
+    # 1) Acquire text
+    article_text = payload.text
+    if not article_text and payload.url:
+        try:
+            # app-wide client (see app.main startup) so connections/TLS are reused
+            client: httpx.AsyncClient = request.app.state.http
+            res = await client.get(payload.url)
+            res.raise_for_status()
+            # CPU-bound on large pages; keep it off the event loop
+            article_text = await asyncio.to_thread(_strip_html, res.text)
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Failed to fetch URL: {e}")
+
+    if not article_text:
+        raise HTTPException(status_code=400, detail="No text to analyze")
+
+    # 2) LLM tasks (reused when the same text was analyzed in the last 24h
+    #    under the same models/prompts)
+    cache_key = f"analyze:{LLM_POLICY}:{int(full)}:{content_hash(article_text)}"
+    cached = await cache_get(cache_key)
+    if cached:
+        score_res, summary_text, claims = cached["score"], cached["summary"], cached["claims"]
+    else:
+        stored_score = None
+        if payload.url:
+            # re-analysis of a known URL: reuse its stored provider response if still valid
+            row = (await db.execute(
+                select(Article.llm_raw, Article.llm_model).where(Article.url == payload.url)
+            )).first()
+            if row:
+                stored_score = llm_score_from_raw(row.llm_raw, row.llm_model, article_text)
+        score_res, summary_text, claims = await _llm_tasks(article_text, full, stored_score)
+        # only cache provider-backed results; a degraded (fallback) analysis is retried next time
+        if (
+            score_res.get("llm_model")
+            and summary_text != summary_fallback(article_text)
+            and (not full or (claims and claims != claims_fallback(article_text)))
+        ):
+            await cache_set(
+                cache_key,
+                {"score": score_res, "summary": summary_text, "claims": claims},
+                ttl=86400,
+            )
+
     scores: Dict[str, Any] = score_res.get("scores", {}) or {}
     raw_highlights: List[Dict[str, Any]] = score_res.get("highlights", []) or []
 
@@ -174,8 +273,7 @@ async def analyze(
 
     # 3c) Last-resort fallback: synthesize highlights from the summary if none found
     if not highlights and summary_text:
-        import re as _re
-        sents = _re.split(r'(?<=[.!?])\s+', summary_text.strip())
+        sents = _RX_SENT.split(summary_text.strip())
         for i, s in enumerate([s for s in sents if len(s.split()) >= 8][:2]):
             highlights.append({
                 "dimension": "framing_choices" if i == 0 else "emotional_tone",
@@ -189,20 +287,19 @@ async def analyze(
     # keep it tight
     highlights = highlights[:20]
 
-    # 4) Enrich claims with sources (bounded)
+    # 4) Enrich claims with sources (bounded; lookups run concurrently)
     enriched_claims: List[Dict[str, Any]] = []
     if full and claims:
-        for c in claims[:8]:
-            q = (c.get("text") or "").strip()
-            if not q:
-                continue
+        async def _sources(q: str) -> List[Dict[str, Any]]:
             try:
-                sources = await asyncio.wait_for(
-                    asyncio.to_thread(find_primary_sources, q, 3),
-                    timeout=5,
-                )
+                return await asyncio.wait_for(find_primary_sources_async(q, 3), timeout=5)
             except asyncio.TimeoutError:
-                sources = []
+                return []
+
+        picked = [(c, (c.get("text") or "").strip()) for c in claims[:8]]
+        picked = [(c, q) for c, q in picked if q]
+        found = await asyncio.gather(*(_sources(q) for _, q in picked))
+        for (c, q), sources in zip(picked, found):
             enriched_claims.append({
                 "text": q,
                 "rationale": c.get("rationale"),
@@ -214,47 +311,66 @@ async def analyze(
     bias_index = _bias_index_from_scores(scores)
     overall = {"value": bias_index, "band": _bias_band(bias_index)}
 
-    # 6) Persist Article
-    row = Article(
-        title=payload.title or (payload.url or "Untitled"),
-        outlet=(payload.outlet or None),
-        url=payload.url,
-        scores=scores,
-        highlights=highlights,        # optional copy on row
-        summary=(summary_text or None),
-        claims=enriched_claims,       # [] when not full
-    )
-    db.add(row)
-    await db.commit()
-    await db.refresh(row)
-
-    # 7) Persist Highlights
-    for h in highlights:
-        db.add(
-            Highlight(
-                article_id=row.id,
-                dimension=h["dimension"],
-                data={
+    # 6) Upsert Article: re-submitting a URL updates its existing row
+    values: Dict[str, Any] = {
+        "title": payload.title or (payload.url or "Untitled"),
+        "outlet": payload.outlet or None,
+        "url": payload.url,
+        "scores": scores,
+        "highlights": highlights,        # optional copy on row
+        "summary": summary_text or None,
+        "claims": enriched_claims,       # [] when not full
+        "llm_raw": score_res.get("llm_raw"),
+        "llm_model": score_res.get("llm_model"),
+    }
+    ins = pg_insert(Article).values(**values)
+    stmt = ins.on_conflict_do_update(
+        index_elements=["url"],
+        index_where=Article.url.isnot(None),
+        set_={
+            **{k: ins.excluded[k] for k in ("title", "outlet", "scores", "highlights", "summary", "claims", "llm_raw", "llm_model")},
+            "updated_at": func.now(),
+        },
+    ).returning(Article.id, Article.published_at)
+    article_id, published_at = (await db.execute(stmt)).one()
+    if payload.url:
+        # drop highlights from an earlier analysis of the same URL
+        await db.execute(delete(Highlight).where(Highlight.article_id == article_id))
+
+    # 7) Persist Highlights, same transaction as the article
+    await _insert_highlights(
+        db,
+        [
+            {
+                "article_id": article_id,
+                "dimension": h["dimension"],
+                "data": {
                     "text": h["text"],
                     "start": h["start"],
                     "end": h["end"],
                     "reason": h["reason"],
                     "confidence": h["confidence"],
                 },
-            )
-        )
+            }
+            for h in highlights
+        ],
+    )
     await db.commit()
 
     # 8) Respond
     payload_out: Dict[str, Any] = {
-        "id": row.id,
-        "title": row.title,
-        "outlet": row.outlet,
-        "url": row.url,
-        "published_at": getattr(row, "published_at", None),
-        "summary": row.summary,
-        "scores": row.scores,
+        "id": article_id,
+        "title": values["title"],
+        "outlet": values["outlet"],
+        "url": values["url"],
+        "published_at": published_at.isoformat() if published_at else None,
+        "summary": values["summary"],
+        "scores": values["scores"],
         "overall": overall,
-        "claims": row.claims or [],
+        "claims": values["claims"] or [],
     }
-    return JSONResponse(status_code=status.HTTP_201_CREATED, content=payload_out)
\ No newline at end of file
+    return Response(
+        content=orjson.dumps(payload_out),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json",
+    )
\ No newline at end of file
@@ -1,17 +1,17 @@
 from __future__ import annotations
 
-from io import StringIO
-from typing import Any, Dict, List, Optional
+import csv
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy import select, desc, delete
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, joinedload, raiseload
 
 from app.db import get_db
 from app.models.article import Article
-from app.models.highlight import Highlight
 
 router = APIRouter(prefix="/articles", tags=["articles"])
 
@@ -46,7 +46,14 @@ async def list_articles(
     limit: int = Query(50, ge=1, le=200),
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(Article).order_by(desc(Article.id)).limit(limit)
+    # ArticleOut reads no relationships (fail loudly on any accidental lazy load)
+    # and doesn't expose the denormalized highlights copy, so don't fetch it
+    stmt = (
+        select(Article)
+        .options(raiseload("*"), defer(Article.highlights, raiseload=True))
+        .order_by(desc(Article.id))
+        .limit(limit)
+    )
     rows = (await db.execute(stmt)).scalars().all()
     return rows
 
@@ -78,25 +85,36 @@ async def export_csv(article_id: int, db: AsyncSession = Depends(get_db)):
       - Claims (row per claim with sources)
       - Highlights table
     """
-    art = await db.get(Article, article_id)
+    # Article + highlights in a single round-trip
+    stmt = (
+        select(Article)
+        .options(joinedload(Article.highlight_rows))
+        .where(Article.id == article_id)
+    )
+    art = (await db.execute(stmt)).unique().scalar_one_or_none()
     if not art:
         raise HTTPException(status_code=404, detail="Not found")
 
-    # Highlights
-    stmt = select(Highlight).where(Highlight.article_id == article_id).order_by(Highlight.id.asc())
-    highlights = (await db.execute(stmt)).scalars().all()
+    filename = f"article_{article_id}_full_export.csv"
+    return StreamingResponse(
+        _export_rows(art, art.highlight_rows),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+class _Echo:
+    """File-like sink for csv.writer: writerow() returns the encoded line."""
 
-    def esc(s: Any) -> str:
-        t = "" if s is None else str(s)
-        t = t.replace('"', '""')
-        if any(c in t for c in [",", "\n", '"']):
-            return f'"{t}"'
-        return t
+    def write(self, value: str) -> str:
+        return value
 
-    buf = StringIO()
+
+async def _export_rows(art: Article, highlights: List[Any]) -> AsyncIterator[str]:
+    w = csv.writer(_Echo(), lineterminator="\n")
 
     # Meta
-    buf.write("section,key,value\n")
+    yield w.writerow(["section", "key", "value"])
     meta = {
         "id": art.id,
         "title": art.title,
@@ -106,57 +124,46 @@ async def export_csv(article_id: int, db: AsyncSession = Depends(get_db)):
         "created_at": getattr(art, "created_at", None),
     }
     for k, v in meta.items():
-        buf.write(",".join(["meta", esc(k), esc(v)]) + "\n")
+        yield w.writerow(["meta", k, v])
 
     # Summary
-    buf.write(",".join(["summary", "text", esc(art.summary or "")]) + "\n")
+    yield w.writerow(["summary", "text", art.summary or ""])
 
     # Scores
     scores = art.scores or {}
     for k, v in scores.items():
-        buf.write(",".join(["scores", esc(k), esc(v)]) + "\n")
+        yield w.writerow(["scores", k, v])
 
-    buf.write("\n")
+    yield w.writerow([])
 
     # Claims (one row per claim)
     # columns: claims,text,rationale,confidence,source_1,source_2
-    buf.write("claims,text,rationale,confidence,source_1,source_2\n")
+    yield w.writerow(["claims", "text", "rationale", "confidence", "source_1", "source_2"])
     for c in (art.claims or []):
-        s1 = (c.get("sources") or [None, None])[0]
-        s2 = (c.get("sources") or [None, None])[1]
+        s1, s2 = ((c.get("sources") or []) + [None, None])[:2]
         s1v = s1.get("url") if isinstance(s1, dict) else ""
         s2v = s2.get("url") if isinstance(s2, dict) else ""
-        row = [
+        yield w.writerow([
             "",  # section label for symmetry
-            esc(c.get("text", "")),
-            esc(c.get("rationale", "")),
+            c.get("text", ""),
+            c.get("rationale", ""),
             c.get("confidence", 0),
-            esc(s1v),
-            esc(s2v),
-        ]
-        buf.write(",".join(map(str, row)) + "\n")
+            s1v,
+            s2v,
+        ])
 
-    buf.write("\n")
+    yield w.writerow([])
 
     # Highlights table
-    buf.write("highlights_id,dimension,text,start,end,reason,confidence\n")
+    yield w.writerow(["highlights_id", "dimension", "text", "start", "end", "reason", "confidence"])
     for h in highlights:
         data = h.data or {}
-        row = [
+        yield w.writerow([
             h.id,
-            esc(h.dimension or ""),
-            esc(data.get("text", "")),
+            h.dimension or "",
+            data.get("text", ""),
             data.get("start", 0),
             data.get("end", 0),
-            esc(data.get("reason", "")),
+            data.get("reason", ""),
             data.get("confidence", 0),
-        ]
-        buf.write(",".join(map(str, row)) + "\n")
-
-    buf.seek(0)
-    filename = f"article_{article_id}_full_export.csv"
-    return StreamingResponse(
-        buf,
-        media_type="text/csv",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
\ No newline at end of file
+        ])
@@ -3,6 +3,7 @@ from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.db import get_db
 from app.models.highlight import Highlight
@@ -33,9 +34,9 @@ async def list_highlights(
     limit: int = 50,
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(Highlight).order_by(Highlight.id.desc()).limit(limit)
+    stmt = select(Highlight).options(raiseload("*")).order_by(Highlight.id.desc()).limit(limit)
     if article_id is not None:
-        stmt = select(Highlight).where(Highlight.article_id == article_id).order_by(Highlight.id.desc()).limit(limit)
+        stmt = select(Highlight).options(raiseload("*")).where(Highlight.article_id == article_id).order_by(Highlight.id.desc()).limit(limit)
     result = await db.execute(stmt)
     return result.scalars().all()
 
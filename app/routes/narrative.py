@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import re
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 from sqlalchemy import select, desc, asc
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload
 
 from app.db import get_db
 from app.models.narrative import Narrative
@@ -37,7 +39,7 @@ async def list_narratives(
     limit: int = Query(50, ge=1, le=200),
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(Narrative)
+    stmt = select(Narrative).options(raiseload("*"))
     stmt = stmt.order_by(desc(Narrative.id) if order == "desc" else asc(Narrative.id)).limit(limit)
     result = await db.execute(stmt)
     return result.scalars().all()
@@ -78,16 +80,17 @@ async def delete_narrative(narrative_id: int, db: AsyncSession = Depends(get_db)
     return None
 
 # ---------- Simple clustering to auto-create narratives ----------
+_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+_STOP = frozenset({"the","a","an","and","or","to","of","for","in","on","with","at","by","from","about"})
+
 def _tokens(s: str) -> set[str]:
-    import re
-    toks = re.findall(r"[A-Za-z0-9]+", (s or "").lower())
-    stop = {"the","a","an","and","or","to","of","for","in","on","with","at","by","from","about"}
-    return {t for t in toks if t not in stop and len(t) > 2}
+    return {t for t in _TOKEN_RE.findall((s or "").lower()) if t not in _STOP and len(t) > 2}
 
 def _sim(a: set[str], b: set[str]) -> float:
     if not a or not b: return 0.0
-    inter = len(a & b); union = len(a | b)
-    return inter/union
+    # |a ∪ b| = |a| + |b| - |a ∩ b|: exact Jaccard without building the union set
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
 
 @router.post("/cluster", response_model=List[NarrativeOut])
 async def cluster_narratives(
@@ -95,7 +98,14 @@ async def cluster_narratives(
     threshold: float = Query(0.35, ge=0.1, le=0.9),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(Article).order_by(Article.id.desc()).limit(window))
+    # only id/title/url are used: index-only scan on idx_articles_recent_cover
+    stmt = (
+        select(Article)
+        .options(load_only(Article.id, Article.title, Article.url, raiseload=True))
+        .order_by(Article.id.desc())
+        .limit(window)
+    )
+    result = await db.execute(stmt)
     arts = list(result.scalars().all())
     if not arts: return []
 
@@ -131,6 +141,6 @@ async def cluster_narratives(
         )
         db.add(n); outs.append(n)
 
+    # one transaction; eager_defaults already populated id/created_at on flush
     await db.commit()
-    for n in outs: await db.refresh(n)
     return outs
\ No newline at end of file
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from app.utils.config import REDIS_URL
+
+# --- Redis when REDIS_URL is set, else a bounded in-process TTL map ---
+_LOCAL_MAX = 1024
+_local: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_redis():
+    if not REDIS_URL:
+        return None
+    from redis.asyncio import Redis
+    return Redis.from_url(REDIS_URL)
+
+
+def content_hash(text: str) -> str:
+    """blake2b-128 hex digest; the one hash behind every cache key here."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+async def cache_get(key: str) -> Optional[Any]:
+    """Return the cached JSON value for key, or None on miss/any cache error."""
+    try:
+        r = _get_redis()
+        if r:
+            raw = await r.get(key)
+            return json.loads(raw) if raw is not None else None
+        hit = _local.get(key)
+        if hit is None:
+            return None
+        expires, raw = hit
+        if expires < time.monotonic():
+            _local.pop(key, None)
+            return None
+        _local.move_to_end(key)
+        return json.loads(raw)
+    except Exception:
+        # fail-safe: a broken cache just means recomputing
+        return None
+
+
+async def cache_set(key: str, value: Any, ttl: int) -> None:
+    try:
+        raw = json.dumps(value, default=str)
+        r = _get_redis()
+        if r:
+            await r.set(key, raw, ex=ttl)
+            return
+        _local[key] = (time.monotonic() + ttl, raw)
+        _local.move_to_end(key)
+        while len(_local) > _LOCAL_MAX:
+            _local.popitem(last=False)
+    except Exception:
+        pass
+
+
+def cached(namespace: str, ttl: int, key_parts: Tuple[str, ...] = ()):
+    """Cache an async `fn(text) -> JSON-able` on blake2b-128(key_parts + text), as content_hash.
+
+    key_parts should pin everything else that determines the output (model,
+    prompts) so changing a prompt invalidates old entries. Exceptions propagate
+    and are not cached. Only wrap low-temperature (near-deterministic) calls.
+    """
+    prefix = hashlib.blake2b(digest_size=16)
+    for part in key_parts:
+        prefix.update(part.encode("utf-8"))
+        prefix.update(b"\0")
+
+    def deco(fn: Callable[[str], Awaitable[Any]]):
+        @functools.wraps(fn)
+        async def wrapper(text: str) -> Any:
+            h = prefix.copy()
+            h.update(text.encode("utf-8"))
+            key = f"{namespace}:{h.hexdigest()}"
+            hit = await cache_get(key)
+            if hit is not None:
+                return hit
+            value = await fn(text)
+            await cache_set(key, value, ttl)
+            return value
+        return wrapper
+    return deco
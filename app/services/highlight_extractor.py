@@ -1,8 +1,8 @@
 import re
-from typing import List, Dict, Tuple
+from typing import List, Dict, Pattern, Tuple
 
 # (dimension, regex, why)
-BIAS_PATTERNS: List[Tuple[str, str, str]] = [
+_RAW: List[Tuple[str, str, str]] = [
     # framing
     ("framing_choices", r"\bcritics (?:say|argue|claim)\b", "Uses the 'critics say' construction."),
     ("framing_choices", r"\b(allegedly|reportedly|is said to)\b", "Distance / hedging phrasing."),
@@ -18,12 +18,17 @@ BIAS_PATTERNS: List[Tuple[str, str, str]] = [
     ("ideological_stance", r"\b(leftwing|rightwing|far[- ]?right|far[- ]?left)\b", "Explicit ideological labeling."),
 ]
 
+# compiled once at import; extract_highlights runs on every /analyze call
+BIAS_PATTERNS: List[Tuple[str, Pattern[str], str]] = [
+    (dim, re.compile(rx, re.I), why) for dim, rx, why in _RAW
+]
+
 def extract_highlights(text: str) -> List[Dict]:
     out: List[Dict] = []
     if not text:
         return out
     for dim, rx, why in BIAS_PATTERNS:
-        for m in re.finditer(rx, text, flags=re.I):
+        for m in rx.finditer(text):
             start, end = m.span()
             out.append({
                 "dimension": dim,
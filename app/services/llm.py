@@ -1,26 +1,54 @@
 from __future__ import annotations
-import json, re
-from typing import Dict, Any, List, Tuple
+import asyncio, json, re
+from typing import Dict, Any, List, Optional, Tuple
+from functools import lru_cache
 
+import httpx
+import orjson
+
+from app.services.cache import cached, content_hash
 from app.utils.config import OPENAI_API_KEY, ANTHROPIC_API_KEY
 
-# --- Optional clients (loaded lazily so missing keys don't crash import) ---
-_openai_client = None
-_anthropic_client = None
+# SDKs are optional: a missing package just disables that provider.
+try:
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+except ImportError:
+    AsyncOpenAI = DefaultAsyncHttpxClient = None
+try:
+    from anthropic import AsyncAnthropic
+except ImportError:
+    AsyncAnthropic = None
 
+# --- Optional async clients (created lazily so missing keys don't crash import) ---
+# One client per provider, shared by every helper below, so keep-alive
+# connections (and their TLS sessions) are reused across calls.
+@lru_cache(maxsize=1)
 def _get_openai():
-    global _openai_client
-    if _openai_client is None and OPENAI_API_KEY:
-        from openai import OpenAI
-        _openai_client = OpenAI(api_key=OPENAI_API_KEY)
-    return _openai_client
+    if not OPENAI_API_KEY or AsyncOpenAI is None:
+        return None
+    # primary provider: raise the keep-alive ceiling for concurrent/batch calls
+    return AsyncOpenAI(
+        api_key=OPENAI_API_KEY,
+        http_client=DefaultAsyncHttpxClient(
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=30.0,
+        ),
+    )
 
+@lru_cache(maxsize=1)
 def _get_anthropic():
-    global _anthropic_client
-    if _anthropic_client is None and ANTHROPIC_API_KEY:
-        from anthropic import Anthropic
-        _anthropic_client = Anthropic(api_key=ANTHROPIC_API_KEY)
-    return _anthropic_client
+    if not ANTHROPIC_API_KEY or AsyncAnthropic is None:
+        return None
+    return AsyncAnthropic(api_key=ANTHROPIC_API_KEY)
+
+_SNIPPET_LIMIT = 8000    # chars of article sent for scoring / claims
+_SUMMARY_LIMIT = 12000   # summaries get a little more context
+
+def _clip(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[:limit]
+
+OPENAI_MODEL = "gpt-4o-mini"               # fast/cheap/good
+ANTHROPIC_MODEL = "claude-3-5-haiku-latest"  # fallback
 
 BIAS_DIMENSIONS = [
     "ideological_stance",
@@ -38,34 +66,82 @@ SYSTEM_INSTRUCTIONS = (
     "Use short, defensible highlights; no extra commentary."
 )
 
-USER_TEMPLATE = """Article text:
-Return ONLY JSON:
-{{
-  "scores": {{
+# Stable prefix first, article last: keeps the prompt prefix byte-identical across
+# requests so provider-side prompt caching can reuse it.
+USER_TEMPLATE = """Return ONLY JSON:
+{
+  "scores": {
     "ideological_stance": <0-100>,
     "factual_grounding": <0-100>,
     "framing_choices": <0-100>,
     "emotional_tone": <0-100>,
     "source_transparency": <0-100>
-  }},
+  },
   "highlights": [
-    {{"dimension":"framing_choices","text":"...", "start":12, "end":24, "reason":"...", "confidence":0.72}}
+    {"dimension":"framing_choices","text":"...", "start":12, "end":24, "reason":"...", "confidence":0.72}
   ]
-}}
+}
 """
+ARTICLE_PREFIX = "Article text follows:\n"
+
+# Tool-call schema in strict mode: OpenAI constrains the arguments to it (every
+# property required, no extra keys, score bounds), so they parse without salvage.
+# _validate_dims still guards the non-strict paths (Anthropic, batch, replay).
+SCORE_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "emit_scores",
+        "description": "Emit bias scores and supporting highlights for the article.",
+        "strict": True,
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "scores": {
+                    "type": "object",
+                    "properties": {d: {"type": "integer", "minimum": 0, "maximum": 100} for d in BIAS_DIMENSIONS},
+                    "required": list(BIAS_DIMENSIONS),
+                    "additionalProperties": False,
+                },
+                "highlights": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "dimension": {"type": "string", "enum": list(BIAS_DIMENSIONS)},
+                            "text": {"type": "string"},
+                            "start": {"type": "integer"},
+                            "end": {"type": "integer"},
+                            "reason": {"type": "string"},
+                            "confidence": {"type": "number"},
+                        },
+                        "required": ["dimension", "text", "start", "end", "reason", "confidence"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["scores", "highlights"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+_JSON_BLOCK_RE = re.compile(r"\{.*\}", re.DOTALL)
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
 
 def _coerce_json(s: str) -> Dict[str, Any]:
-    # try plain json first
-    try:
-        return json.loads(s)
-    except Exception:
-        pass
+    # fast path: the whole body is a JSON object (JSON mode, well-behaved models)
+    body = s.strip()
+    if body.startswith("{"):
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
     # try to extract the first {...} block
-    m = re.search(r"\{.*\}", s, flags=re.S)
+    m = _JSON_BLOCK_RE.search(s)
     if m:
         try:
-            return json.loads(m.group(0))
-        except Exception:
+            return orjson.loads(m.group(0))
+        except orjson.JSONDecodeError:
             pass
     raise ValueError("LLM did not return valid JSON")
 
@@ -104,80 +180,248 @@ def _rule_based(text: str) -> Dict[str, Any]:
         "highlights": highlights[:3],
     }
 
-def llm_score(text: str) -> Dict[str, Any]:
-    """Try OpenAI → Anthropic → rules. Always returns dict with 'scores' and 'highlights'."""
-    snippet = text[:8000]  # keep prompt smaller/cheaper
+HEDGE_DELAY = 3.0   # OpenAI head start before Anthropic is raced against it
+
+# Everything besides the text that determines a score; also the cache key prefix.
+_SCORE_KEY = (OPENAI_MODEL, ANTHROPIC_MODEL, SYSTEM_INSTRUCTIONS, USER_TEMPLATE, json.dumps(SCORE_TOOL))
+SCORE_POLICY = content_hash("\0".join(_SCORE_KEY))
 
-    # 1) OpenAI (gpt-4o-mini is fast/cheap/good)
+def _with_raw(parsed: Dict[str, Any], model: str, snippet: str) -> Dict[str, Any]:
+    """Validated scores plus the provider payload they came from (stored as articles.llm_raw)."""
+    data = dict(parsed)
+    _validate_dims(data)
+    return {
+        "scores": data["scores"],
+        "highlights": data["highlights"],
+        "llm_model": model,
+        # snippet = the exact text scored, so stored rows can be re-scored/re-batched offline
+        "llm_raw": {"policy": SCORE_POLICY, "snippet": snippet, "response": parsed},
+    }
+
+async def _oai_score(snippet: str) -> Dict[str, Any]:
+    msg = await _get_openai().chat.completions.create(
+        model=OPENAI_MODEL,
+        messages=[
+            {"role":"system", "content": SYSTEM_INSTRUCTIONS},
+            {"role":"user", "content": USER_TEMPLATE + ARTICLE_PREFIX + snippet}
+        ],
+        tools=[SCORE_TOOL],
+        tool_choice={"type": "function", "function": {"name": "emit_scores"}},
+        temperature=0.2,
+    )
+    return _with_raw(orjson.loads(msg.choices[0].message.tool_calls[0].function.arguments), OPENAI_MODEL, snippet)
+
+async def _anthropic_score(snippet: str) -> Dict[str, Any]:
+    msg = await _get_anthropic().messages.create(
+        model=ANTHROPIC_MODEL,
+        max_tokens=1200,
+        temperature=0.2,
+        system=[{"type": "text", "text": SYSTEM_INSTRUCTIONS}],
+        messages=[
+            {"role":"user", "content": [
+                # breakpoint after the scaffold: system + schema are the cached prefix
+                {"type": "text", "text": USER_TEMPLATE, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": ARTICLE_PREFIX + snippet},
+            ]}
+        ]
+    )
+    # anthropic returns content as blocks
+    out = "".join(block.text for block in msg.content if getattr(block, "type", "") == "text")
+    return _with_raw(_coerce_json(out), ANTHROPIC_MODEL, snippet)
+
+@cached("llm_score", ttl=86400, key_parts=_SCORE_KEY)
+async def _score_llm(snippet: str) -> Dict[str, Any]:
+    """Hedged OpenAI/Anthropic race: first valid result wins. Raises if every provider fails."""
+    oai, claude = _get_openai(), _get_anthropic()
+    if not (oai or claude):
+        raise RuntimeError("no LLM provider configured")
+
+    pending: set = set()
     try:
-        oai = _get_openai()
         if oai:
-            msg = oai.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role":"system", "content": SYSTEM_INSTRUCTIONS},
-                    {"role":"user", "content": USER_TEMPLATE.format(snippet=snippet)}
-                ],
-                temperature=0.2,
-            )
-            out = msg.choices[0].message.content
-            data = _coerce_json(out)
-            _validate_dims(data)
-            return data
+            pending.add(asyncio.create_task(_oai_score(snippet)))
+            done, pending = await asyncio.wait(pending, timeout=HEDGE_DELAY if claude else None)
+            for t in done:
+                if t.exception() is None:
+                    return t.result()
+        # OpenAI failed or is slow: hedge with Anthropic, keep OpenAI running
+        if claude:
+            pending.add(asyncio.create_task(_anthropic_score(snippet)))
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for t in done:
+                if t.exception() is None:
+                    return t.result()
+    finally:
+        for t in pending:
+            t.cancel()
+    raise RuntimeError("all LLM providers failed")
+
+def llm_score_from_raw(
+    llm_raw: Optional[Dict[str, Any]], llm_model: Optional[str], text: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Re-parse a stored provider response instead of calling the API.
+
+    Returns None unless it was produced under the current models/prompts
+    (SCORE_POLICY) and, when text is given, for that same text; the caller then
+    scores normally. Stale rows can be re-scored offline from llm_raw["snippet"]
+    (e.g. with llm_score_batch).
+    """
+    if not llm_raw or llm_model not in (OPENAI_MODEL, ANTHROPIC_MODEL):
+        return None
+    snippet = llm_raw.get("snippet")
+    if llm_raw.get("policy") != SCORE_POLICY or not isinstance(snippet, str):
+        return None
+    if text is not None and _clip(text, _SNIPPET_LIMIT) != snippet:
+        return None
+    try:
+        return _with_raw(llm_raw["response"], llm_model, snippet)
     except Exception:
-        pass
+        return None
+
+def score_fallback(text: str) -> Dict[str, Any]:
+    """No-LLM scores (the rules llm_score_async falls back to)."""
+    return _rule_based(text)
 
-    # 2) Anthropic fallback
+async def llm_score_async(text: str) -> Dict[str, Any]:
+    """Hedged OpenAI/Anthropic → rules. Always returns dict with 'scores' and 'highlights'
+    (+ 'llm_raw'/'llm_model' provenance when a provider answered)."""
+    snippet = _clip(text, _SNIPPET_LIMIT)  # keep prompt smaller/cheaper
     try:
-        claude = _get_anthropic()
-        if claude:
-            msg = claude.messages.create(
-                model="claude-3-5-haiku-latest",
-                max_tokens=1200,
-                temperature=0.2,
-                system=SYSTEM_INSTRUCTIONS,
-                messages=[
-                    {"role":"user", "content": USER_TEMPLATE.format(snippet=snippet)}
-                ]
-            )
-            # anthropic returns content as blocks
-            out = "".join(block.text for block in msg.content if getattr(block, "type", "") == "text")
-            data = _coerce_json(out)
-            _validate_dims(data)
-            return data
+        return await _score_llm(snippet)
     except Exception:
         pass
 
     # 3) Rules
-    return _rule_based(text)
+    return score_fallback(text)
 
-def llm_summary(text: str) -> str:
+# --- Batch scoring: several articles per request (one RTT + one system prompt) ---
+BATCH_ROWS = 8          # rows per request; past this, per-row quality drops
+BATCH_SNIPPET = 4000    # per-row text budget so a full batch stays ~8k tokens
+
+BATCH_TEMPLATE = """Score each row below independently.
+Return ONLY JSON, one result per row, in row order:
+{{
+  "results": [
+    {{"row": 1, "scores": {{<each of {dims}: 0-100>}}, "highlights": [{{"dimension":"...","text":"...","start":0,"end":0,"reason":"...","confidence":0.7}}]}}
+  ]
+}}
+Highlight start/end are offsets within that row's text.
+
+{rows}
+"""
+
+async def _score_rows(texts: List[str]) -> List[Dict[str, Any]]:
+    oai = _get_openai()
+    if not oai:
+        # no batch-capable provider; llm_score_async still tries Anthropic per row
+        return list(await asyncio.gather(*(llm_score_async(t) for t in texts)))
+
+    results: List[Any] = [None] * len(texts)
     try:
-        from app.utils.config import OPENAI_API_KEY
-        if OPENAI_API_KEY:
-            from openai import OpenAI
-            client = OpenAI(api_key=OPENAI_API_KEY)
-            prompt = (
-                "You are a neutral news analyst. Write a cohesive single paragraph of 10–12 sentences "
-                "summarizing the article. Be factual and concise. Avoid opinionated language. "
-                "Do not add facts that aren’t in the text. No bullets; one paragraph."
-            )
-            resp = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": prompt},
-                    {"role": "user", "content": text[:12000]},
-                ],
-                temperature=0.2,
-            )
-            return resp.choices[0].message.content.strip()
+        rows = "\n---\n".join(f"Row {n}:\n{t[:BATCH_SNIPPET]}" for n, t in enumerate(texts, 1))
+        msg = await oai.chat.completions.create(
+            model=OPENAI_MODEL,
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": SYSTEM_INSTRUCTIONS},
+                {"role": "user", "content": BATCH_TEMPLATE.format(dims=", ".join(BIAS_DIMENSIONS), rows=rows)},
+            ],
+            temperature=0.2,
+        )
+        data = _coerce_json(msg.choices[0].message.content)
+        for n, r in enumerate(data.get("results") or []):
+            try:
+                i = int(r.get("row", n + 1)) - 1
+                if not 0 <= i < len(texts) or results[i] is not None:
+                    continue
+                row = {"scores": r.get("scores") or {}, "highlights": r.get("highlights")}
+                _validate_dims(row)
+                results[i] = row
+            except Exception:
+                continue  # malformed row -> rules below
     except Exception:
         pass
 
-    import re
-    sents = re.split(r'(?<=[.!?])\s+', text.strip())
+    return [r if r is not None else _rule_based(t) for r, t in zip(results, texts)]
+
+async def llm_score_batch(texts: List[str]) -> List[Dict[str, Any]]:
+    """Score many articles with one OpenAI call per BATCH_ROWS texts (batches run concurrently).
+
+    Returns one llm_score_async-shaped dict per input, in order; rows the model
+    omits or malforms fall back to _rule_based.
+    """
+    chunks = await asyncio.gather(
+        *(_score_rows(texts[i:i + BATCH_ROWS]) for i in range(0, len(texts), BATCH_ROWS))
+    )
+    return [r for chunk in chunks for r in chunk]
+
+SUMMARY_INSTRUCTIONS = (
+    "You are a neutral news analyst. Write a cohesive single paragraph of 10–12 sentences "
+    "summarizing the article. Be factual and concise. Avoid opinionated language. "
+    "Do not add facts that aren’t in the text. No bullets; one paragraph."
+)
+
+CLAIMS_INSTRUCTIONS = (
+    "You extract atomic, checkable claims from news articles. "
+    "Return STRICT JSON with key 'claims': "
+    "[{text:..., rationale:..., confidence:0-1}]. 3–8 items, short and factual."
+)
+
+STREAM_DEADLINE = 8.0   # seconds; past this we drop the stream and fall back
+
+async def _stream_openai(messages: List[Dict[str, str]], deadline: float = STREAM_DEADLINE, **kw: Any) -> str:
+    """Stream a chat completion and join the deltas.
+
+    The deadline covers connect/time-to-first-byte as well as the stream itself;
+    raises asyncio.TimeoutError (the stream is closed) once it passes.
+    """
+    client = _get_openai()
+    if not client:
+        raise RuntimeError("OpenAI not configured")
+
+    async def _collect() -> str:
+        stream = await client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=messages,
+            temperature=0.2,
+            stream=True,
+            **kw,
+        )
+        parts: List[str] = []
+        try:
+            async for ev in stream:
+                if ev.choices:
+                    parts.append(ev.choices[0].delta.content or "")
+        finally:
+            await stream.close()
+        return "".join(parts)
+
+    return await asyncio.wait_for(_collect(), timeout=deadline)
+
+@cached("llm_summary", ttl=86400, key_parts=(OPENAI_MODEL, SUMMARY_INSTRUCTIONS))
+async def _summary_llm(snippet: str) -> str:
+    out = await _stream_openai([
+        {"role": "system", "content": SUMMARY_INSTRUCTIONS},
+        {"role": "user", "content": snippet},
+    ])
+    if not out.strip():
+        raise ValueError("empty summary")
+    return out.strip()
+
+def summary_fallback(text: str) -> str:
+    """No-LLM summary: the leading sentences."""
+    sents = _SENT_SPLIT_RE.split(text.strip())
     return " ".join(sents[:12])[:2500]
 
+async def llm_summary_async(text: str) -> str:
+    try:
+        return await _summary_llm(_clip(text, _SUMMARY_LIMIT))
+    except Exception:
+        pass
+
+    return summary_fallback(text)
+
 def _validate_dims(data: Dict[str, Any]) -> None:
     scores = data.get("scores", {})
     for d in BIAS_DIMENSIONS:
@@ -187,47 +431,41 @@ def _validate_dims(data: Dict[str, Any]) -> None:
     if "highlights" not in data or not isinstance(data["highlights"], list):
         data["highlights"] = []
 
-def extract_claims(text: str) -> List[Dict[str, Any]]:
+@cached("extract_claims", ttl=86400, key_parts=(OPENAI_MODEL, CLAIMS_INSTRUCTIONS))
+async def _claims_llm(snippet: str) -> List[Dict[str, Any]]:
+    raw = await _stream_openai([
+        {"role":"system","content":CLAIMS_INSTRUCTIONS},
+        {"role":"user","content":snippet},
+    ], response_format={"type": "json_object"})
+    data = orjson.loads(raw)
+    claims = data.get("claims", [])
+    return [
+        {
+            "text": c.get("text","").strip(),
+            "rationale": c.get("rationale","").strip(),
+            "confidence": float(c.get("confidence", 0.5))
+        }
+        for c in claims if c.get("text")
+    ][:8]
+
+def claims_fallback(text: str) -> List[Dict[str, Any]]:
+    """No-LLM claims: a few strong sentences."""
+    sents = _SENT_SPLIT_RE.split(text.strip())
+    pick = [s for s in sents if len(s) > 60][:4]
+    return [{"text": s, "rationale": "salient sentence", "confidence": 0.4} for s in pick]
+
+async def extract_claims_async(text: str) -> List[Dict[str, Any]]:
     """
     Returns a small set of atomic claims:
     [{ "text": str, "rationale": str, "confidence": float }]
     """
     try:
-        from app.utils.config import OPENAI_API_KEY
-        if OPENAI_API_KEY:
-            from openai import OpenAI
-            client = OpenAI(api_key=OPENAI_API_KEY)
-            system = (
-                "You extract atomic, checkable claims from news articles. "
-                "Return STRICT JSON with key 'claims': "
-                "[{text:..., rationale:..., confidence:0-1}]. 3–8 items, short and factual."
-            )
-            resp = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role":"system","content":system},
-                    {"role":"user","content":text[:8000]},
-                ],
-                temperature=0.2,
-            )
-            import json, re
-            raw = resp.choices[0].message.content
-            block = re.search(r"\{.*\}", raw, flags=re.S)
-            data = json.loads(block.group(0)) if block else json.loads(raw)
-            claims = data.get("claims", [])
-            return [
-                {
-                    "text": c.get("text","").strip(),
-                    "rationale": c.get("rationale","").strip(),
-                    "confidence": float(c.get("confidence", 0.5))
-                }
-                for c in claims if c.get("text")
-            ][:8]
+        return await _claims_llm(_clip(text, _SNIPPET_LIMIT))
     except Exception:
         pass
 
-    # crude fallback: pick a few strong sentences as "claims"
-    import re
-    sents = re.split(r'(?<=[.!?])\s+', text.strip())
-    pick = [s for s in sents if len(s) > 60][:4]
-    return [{"text": s, "rationale": "salient sentence", "confidence": 0.4} for s in pick]
\ No newline at end of file
+    return claims_fallback(text)
+
+# Changes whenever any model or prompt behind score/summary/claims does; callers
+# caching whole analyses put it in their keys.
+LLM_POLICY = content_hash("\0".join((SCORE_POLICY, OPENAI_MODEL, SUMMARY_INSTRUCTIONS, CLAIMS_INSTRUCTIONS)))
@@ -1,19 +1,24 @@
 from __future__ import annotations
 
-from typing import List, Dict, Any
+import heapq
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 from urllib.parse import urlparse
 
+import httpx
+
+from app.services.cache import cache_get, cache_set, content_hash
 from app.utils.config import TAVILY_API_KEY
 
 
-def _bonus(url: str, title: str = "") -> float:
-    """Heuristic bump for likely primary sources."""
-    u = (url or "").lower()
-    t = (title or "").lower()
-    host = urlparse(u).netloc
+_PRIMARY_TLDS = (".gov", ".mil", ".edu")
+_AGG = ("wikipedia.org", "reddit.com", "x.com", "twitter.com", "facebook.com", "medium.com")
+
 
+def _bonus(host: str, u: str, t: str = "") -> float:
+    """Heuristic bump for likely primary sources (host/url/title already lowercased)."""
     b = 0.0
-    if host.endswith(".gov") or host.endswith(".mil") or host.endswith(".edu"):
+    if host.endswith(_PRIMARY_TLDS):
         b += 0.25
     if u.endswith(".pdf") or "filetype:pdf" in u:
         b += 0.15
@@ -22,74 +27,109 @@ def _bonus(url: str, title: str = "") -> float:
     if "official" in t or "statement" in t:
         b += 0.08
     # penalize obvious aggregators a touch
-    for bad in ("wikipedia.org", "reddit.com", "x.com", "twitter.com", "facebook.com", "medium.com"):
-        if host.endswith(bad):
-            b -= 0.25
-            break
+    if host.endswith(_AGG):
+        b -= 0.25
     return b
 
 
-def _unique_by_domain(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    seen = set()
-    out: List[Dict[str, Any]] = []
-    for it in items:
-        host = urlparse((it.get("url") or "").lower()).netloc
-        if not host or host in seen:
+def _biased_query(query: str) -> str:
+    # Bias the search itself toward official docs and records.
+    return (
+        f"{query} "
+        'site:.gov OR site:.mil OR site:.edu OR "press release" OR "official statement" '
+        'OR filetype:pdf'
+    )
+
+
+def _max_results(k: int) -> int:
+    # Pull a few extra so we can re-rank/dedupe.
+    return min(max(k * 3, 5), 12)
+
+
+def _rank(raw: Dict[str, Any], k: int) -> List[Dict[str, Any]]:
+    # One pass: keep the best-scoring hit per domain, then take the top k.
+    # Ties rank by result position (earliest first), like a stable sort would.
+    best_by_host: Dict[str, Tuple[float, int, Dict[str, Any]]] = {}
+    for i, r in enumerate(raw.get("results", [])):
+        url = r.get("url") or ""
+        title = r.get("title") or url
+        base = float(r.get("score") or 0.0)
+        u = url.lower()
+        host = urlparse(u).netloc if u else ""
+        if not host:
             continue
-        seen.add(host)
-        out.append(it)
-    return out
+        score = max(0.0, min(1.0, base + _bonus(host, u, title.lower())))
+        prev = best_by_host.get(host)
+        if prev is None or score > prev[0]:
+            best_by_host[host] = (score, -i, {
+                "title": title,
+                "url": url,
+                "score": score,
+                "published": r.get("published_date"),
+            })
 
+    top = heapq.nlargest(max(1, k), best_by_host.values(), key=lambda t: (t[0], t[1]))
+    return [item for _, _, item in top]
 
-def find_primary_sources(query: str, k: int = 3) -> List[Dict[str, Any]]:
-    """
-    Return up to k likely-primary sources for a claim.
-    Each item: { title, url, score, published }
-    Returns [] if Tavily is not configured or any error occurs.
-    """
-    if not TAVILY_API_KEY:
-        return []
 
-    try:
-        from tavily import TavilyClient
+# --- Tavily REST over one shared HTTP/2 client ---
+SEARCH_TTL = 3600  # news moves; an hour is plenty for repeated claims across a story
 
-        client = TavilyClient(api_key=TAVILY_API_KEY)
 
-        # Bias the search itself toward official docs and records.
-        biased_query = (
-            f"{query} "
-            'site:.gov OR site:.mil OR site:.edu OR "press release" OR "official statement" '
-            'OR filetype:pdf'
-        )
+@lru_cache(maxsize=1)
+def _get_tavily_http() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url="https://api.tavily.com",
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=32),
+        headers={"Authorization": f"Bearer {TAVILY_API_KEY}"},
+    )
 
-        # Pull a few extra so we can re-rank/dedupe.
-        raw = client.search(
-            query=biased_query,
-            search_depth="advanced",
-            max_results=min(max(k * 3, 5), 12),
-            include_answer=False,
-        )
 
-        items: List[Dict[str, Any]] = []
-        for r in raw.get("results", []):
-            url = r.get("url") or ""
-            title = r.get("title") or url
-            base = float(r.get("score") or 0.0)
-            bonus = _bonus(url, title)
-            items.append(
-                {
-                    "title": title,
-                    "url": url,
-                    "score": max(0.0, min(1.0, base + bonus)),
-                    "published": r.get("published_date"),
-                }
-            )
-
-        # Re-rank with our bonus, prefer unique domains, then trim.
-        items.sort(key=lambda x: x["score"], reverse=True)
-        items = _unique_by_domain(items)
-        return items[: max(1, k)]
+async def aclose_tavily() -> None:
+    """Close the shared Tavily client (app shutdown)."""
+    if _get_tavily_http.cache_info().currsize:
+        await _get_tavily_http().aclose()
+        _get_tavily_http.cache_clear()
+
 
+async def _search(query: str, k: int) -> List[Dict[str, Any]]:
+    if not TAVILY_API_KEY:
+        return []
+    try:
+        r = await _get_tavily_http().post(
+            "/search",
+            json={
+                "query": _biased_query(query),
+                "search_depth": "advanced",
+                "max_results": _max_results(k),
+                "include_answer": False,
+            },
+        )
+        r.raise_for_status()
+        return _rank(r.json(), k)
     except Exception:
         # fail-safe: no sources rather than breaking analysis
-        return []
\ No newline at end of file
+        return []
+
+
+async def find_primary_sources_async(query: str, k: int = 3) -> List[Dict[str, Any]]:
+    """
+    Return up to k likely-primary sources for a claim.
+    Each item: { title, url, score, published }
+    Returns [] if Tavily is not configured or any error occurs.
+
+    Results are cached per normalized query + k; empty results (no key / error)
+    are not cached so a transient Tavily failure isn't pinned for an hour.
+    """
+    q = " ".join(query.split())
+    # case-folded for the key only; Tavily gets the original casing (proper nouns, acronyms)
+    key = "tavily:" + content_hash(f"{q.lower()}|{k}")
+    hit = await cache_get(key)
+    if hit is not None:
+        return hit
+    items = await _search(q, k)
+    if items:
+        await cache_set(key, items, SEARCH_TTL)
+    return items
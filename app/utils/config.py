@@ -7,4 +7,9 @@ TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql+asyncpg://localhost:5432/biaslab")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
-CORS_ORIGINS = [o.strip() for o in os.getenv("CORS_ORIGINS", "http://localhost:5173").split(",") if o.strip()]
\ No newline at end of file
+REDIS_URL = os.getenv("REDIS_URL", "")
+CORS_ORIGINS = [o.strip() for o in os.getenv("CORS_ORIGINS", "http://localhost:5173").split(",") if o.strip()]
+# Threads for CPU-bound HTML parsing off the event loop (LLM/search calls are async)
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "4"))
+# How many LLM calls may be in flight per process
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "32"))
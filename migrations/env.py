@@ -8,8 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 # --- Load app metadata (import registers all models) ---
 from app.db import Base
-from app.models.article import Article  # noqa: F401
-from app.models.highlight import Highlight  # noqa: F401
+import app.models  # noqa: F401  (registers Article, Highlight, Narrative)
 
 # Alembic Config
 config = context.config
@@ -0,0 +1,78 @@
+"""create base tables
+
+Revision ID: 0f1e2d3c4b5a
+Revises: 
+Create Date: 2026-10-14 11:48:20.907115
+
+Tables used to be created by Base.metadata.create_all at app startup, so
+this revision was added underneath the existing history. It creates the
+schema as it stood before 39b7932d7135 and is a no-op for tables that
+already exist; the later revisions add the remaining columns/indexes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0f1e2d3c4b5a"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema (idempotent if tables already exist)."""
+    bind = op.get_bind()
+    existing = set(sa.inspect(bind).get_table_names())
+
+    if "articles" not in existing:
+        op.create_table(
+            "articles",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("title", sa.String(512), nullable=False),
+            sa.Column("outlet", sa.String(128), nullable=True),
+            sa.Column("url", sa.String(1024), nullable=True),
+            sa.Column("scores", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+            sa.Column("highlights", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+            sa.Column(
+                "created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
+            ),
+        )
+        op.create_index("ix_articles_id", "articles", ["id"])
+
+    if "narratives" not in existing:
+        op.create_table(
+            "narratives",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("label", sa.String(256), nullable=False),
+            sa.Column("data", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        )
+        op.create_index("ix_narratives_id", "narratives", ["id"])
+
+    if "highlights" not in existing:
+        op.create_table(
+            "highlights",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column(
+                "article_id",
+                sa.Integer(),
+                sa.ForeignKey("articles.id", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            sa.Column("dimension", sa.String(64), nullable=False),
+            sa.Column("data", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+        op.create_index("ix_highlights_id", "highlights", ["id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("highlights")
+    op.drop_table("narratives")
+    op.drop_table("articles")
@@ -1,7 +1,7 @@
 """add summary to articles
 
 Revision ID: 39b7932d7135
-Revises: 
+Revises: 0f1e2d3c4b5a
 Create Date: 2025-08-09 14:46:43.224913
 """
 from typing import Sequence, Union
@@ -12,7 +12,7 @@ import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision: str = "39b7932d7135"
-down_revision: Union[str, Sequence[str], None] = None
+down_revision: Union[str, Sequence[str], None] = "0f1e2d3c4b5a"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
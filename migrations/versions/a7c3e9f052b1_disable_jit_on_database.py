@@ -0,0 +1,28 @@
+"""disable JIT on the app database
+
+Revision ID: a7c3e9f052b1
+Revises: f2a6c9d1e837
+Create Date: 2026-10-14 15:02:11.204518
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c3e9f052b1"
+down_revision: Union[str, Sequence[str], None] = "f2a6c9d1e837"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Server-side, so it also holds for sessions opened through PgBouncer, which
+    # drops client startup parameters. Applies to new sessions only.
+    op.execute("DO $$ BEGIN EXECUTE format('ALTER DATABASE %I SET jit = off', current_database()); END $$")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DO $$ BEGIN EXECUTE format('ALTER DATABASE %I RESET jit', current_database()); END $$")
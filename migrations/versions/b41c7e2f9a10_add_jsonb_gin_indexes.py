@@ -0,0 +1,43 @@
+"""add jsonb_path_ops GIN indexes
+
+Revision ID: b41c7e2f9a10
+Revises: a998db096cd2
+Create Date: 2026-10-14 09:12:40.518233
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b41c7e2f9a10"
+down_revision: Union[str, Sequence[str], None] = "a998db096cd2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, column)
+GIN_INDEXES = [
+    ("idx_articles_scores_gin", "articles", "scores"),
+    ("idx_articles_claims_gin", "articles", "claims"),
+    ("idx_highlights_data_gin", "highlights", "data"),
+    ("idx_narratives_data_gin", "narratives", "data"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema (idempotent if indexes already exist)."""
+    for name, table, column in GIN_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "jsonb_path_ops"},
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(GIN_INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
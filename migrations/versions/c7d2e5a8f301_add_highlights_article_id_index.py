@@ -0,0 +1,31 @@
+"""add (article_id, id) index to highlights
+
+Revision ID: c7d2e5a8f301
+Revises: b41c7e2f9a10
+Create Date: 2026-10-14 09:40:07.102458
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d2e5a8f301"
+down_revision: Union[str, Sequence[str], None] = "b41c7e2f9a10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema (idempotent if the index already exists)."""
+    op.create_index(
+        "idx_highlights_article_id_id",
+        "highlights",
+        ["article_id", "id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_highlights_article_id_id", table_name="highlights", if_exists=True)
@@ -0,0 +1,68 @@
+"""add partial unique index on articles.url
+
+Older analyses of a duplicated URL are moved (not dropped) into
+articles_url_dupes / highlights_url_dupes before the index is built, keeping
+the newest row per URL live; downgrade() moves them back. Drop the two backup
+tables by hand once they're no longer wanted.
+
+Revision ID: d3f8a1c6b924
+Revises: c7d2e5a8f301
+Create Date: 2026-10-14 11:05:52.664391
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d3f8a1c6b924"
+down_revision: Union[str, Sequence[str], None] = "c7d2e5a8f301"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep only the newest analysis per URL so the unique index can be built;
+    # back up the older rows and their highlights first (the CASCADE would drop them).
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS articles_url_dupes AS
+        SELECT a.* FROM articles a
+        WHERE a.url IS NOT NULL
+          AND EXISTS (SELECT 1 FROM articles b WHERE b.url = a.url AND b.id > a.id)
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS highlights_url_dupes AS
+        SELECT h.* FROM highlights h
+        WHERE h.article_id IN (SELECT id FROM articles_url_dupes)
+        """
+    )
+    op.execute("DELETE FROM articles WHERE id IN (SELECT id FROM articles_url_dupes)")
+    op.create_index(
+        "uq_articles_url",
+        "articles",
+        ["url"],
+        unique=True,
+        postgresql_where=sa.text("url IS NOT NULL"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_articles_url", table_name="articles", if_exists=True)
+    # restore the analyses upgrade() set aside
+    op.execute(
+        "INSERT INTO articles SELECT * FROM articles_url_dupes "
+        "WHERE id NOT IN (SELECT id FROM articles)"
+    )
+    op.execute(
+        "INSERT INTO highlights SELECT * FROM highlights_url_dupes "
+        "WHERE id NOT IN (SELECT id FROM highlights)"
+    )
+    op.execute("DROP TABLE IF EXISTS highlights_url_dupes")
+    op.execute("DROP TABLE IF EXISTS articles_url_dupes")
@@ -0,0 +1,36 @@
+"""add covering index for newest-first article scans
+
+Revision ID: e5b9c2d7f416
+Revises: d3f8a1c6b924
+Create Date: 2026-10-14 12:20:33.418702
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b9c2d7f416"
+down_revision: Union[str, Sequence[str], None] = "d3f8a1c6b924"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "idx_articles_recent_cover",
+        "articles",
+        [sa.text("id DESC")],
+        postgresql_include=["title", "outlet", "url", "published_at"],
+        if_not_exists=True,
+    )
+    # Index-only scans need an up-to-date visibility map; VACUUM can't run in a transaction.
+    with op.get_context().autocommit_block():
+        op.execute("VACUUM ANALYZE articles")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_articles_recent_cover", table_name="articles", if_exists=True)
@@ -0,0 +1,22 @@
+"""add llm_raw, llm_model to articles"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "f2a6c9d1e837"
+down_revision: Union[str, Sequence[str], None] = "e5b9c2d7f416"
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.add_column(
+        "articles",
+        sa.Column("llm_raw", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+    op.add_column("articles", sa.Column("llm_model", sa.Text(), nullable=True))
+
+def downgrade() -> None:
+    op.drop_column("articles", "llm_model")
+    op.drop_column("articles", "llm_raw")